@@ -1,11 +1,274 @@
-from django.test import TestCase, Client
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 
+from django_health_metrics import views
+
 class HealthViewTests(TestCase):
     def setUp(self):
         self.client = Client()
+        views._CACHE.update(ts=0.0, payload=None)
+        views._CHECK_FUTURES.clear()
 
     def test_health_view(self):
         response = self.client.get(reverse('health'))
         self.assertEqual(response.status_code, 200)
-        self.assertIn('memory', response.json())
\ No newline at end of file
+        self.assertIn('memory', response.json())
+        self.assertEqual(response.json()['overall'], views.STATUS_HEALTHY)
+
+    def test_health_view_reuses_cached_result(self):
+        with mock.patch.object(views, '_run_checks', return_value={"overall": "healthy"}) as run_checks:
+            self.client.get(reverse('health'))
+            self.client.get(reverse('health'))
+        self.assertEqual(run_checks.call_count, 1)
+
+    def test_health_view_fresh_bypasses_cache(self):
+        with mock.patch.object(views, '_run_checks', return_value={"overall": "healthy"}) as run_checks:
+            self.client.get(reverse('health'))
+            self.client.get(reverse('health'), {'fresh': '1'})
+        self.assertEqual(run_checks.call_count, 2)
+
+    def test_concurrent_requests_share_one_run(self):
+        started, release, follower_waiting = threading.Event(), threading.Event(), threading.Event()
+        payload = {"overall": "healthy"}
+        follower_payloads = []
+
+        def slow_run_checks():
+            started.set()
+            release.wait(5)
+            return payload
+
+        class SignallingFuture(Future):
+            # Only followers wait on the shared future; the leader returns its payload directly.
+            def result(self, timeout=None):
+                follower_waiting.set()
+                return super().result(timeout)
+
+        with mock.patch.object(views, '_run_checks', side_effect=slow_run_checks) as run_checks, \
+                mock.patch.object(views, 'Future', SignallingFuture):
+            leader = threading.Thread(target=views._shared_run_checks)
+            leader.start()
+            self.assertTrue(started.wait(5))
+            follower = threading.Thread(target=lambda: follower_payloads.append(views._shared_run_checks()))
+            follower.start()
+            self.assertTrue(follower_waiting.wait(5))
+            release.set()
+            leader.join(5)
+            follower.join(5)
+        self.assertEqual(run_checks.call_count, 1)
+        self.assertEqual(follower_payloads, [payload])
+
+    def test_slow_check_is_reported_after_deadline(self):
+        def hang():
+            time.sleep(0.5)
+            return {}
+        hang.__name__ = 'check_redis'
+
+        with mock.patch.object(views, '_IO_CHECKS', [('redis', hang)]), \
+                mock.patch.dict(views._TEMPLATE, {'redis': None}), \
+                mock.patch.object(views, 'PER_CHECK_TIMEOUT', 0.1):
+            results = views._run_checks()
+        self.assertEqual(results['redis']['message'], 'deadline exceeded')
+        self.assertEqual(results['overall'], views.STATUS_UNHEALTHY)
+
+    def test_hung_check_is_not_submitted_again(self):
+        calls = []
+
+        def hang():
+            calls.append(1)
+            time.sleep(0.5)
+            return {}
+        hang.__name__ = 'check_redis'
+
+        with mock.patch.object(views, '_IO_CHECKS', [('redis', hang)]), \
+                mock.patch.dict(views._TEMPLATE, {'redis': None}), \
+                mock.patch.object(views, 'PER_CHECK_TIMEOUT', 0.1):
+            views._run_checks()
+            results = views._run_checks()
+        self.assertEqual(results['redis']['message'], 'previous check still running')
+        self.assertEqual(len(calls), 1)
+
+    def test_cache_backend_error_is_reported_unhealthy(self):
+        health_checker = views.HealthChecker()
+        health_checker._configured["cache"] = True
+        with mock.patch.object(views.cache, 'set', side_effect=RuntimeError("cache down")), \
+                mock.patch.object(views.logger, 'exception') as log_exception:
+            result = health_checker.run_check(health_checker.check_cache)
+        self.assertEqual(result["status"], views.STATUS_UNHEALTHY)
+        self.assertEqual(result["message"], "cache down")
+        log_exception.assert_not_called()
+
+    def test_celery_ping_result_is_reused_within_ttl(self):
+        for workers, expected_status in (([{"worker@host": {"ok": "pong"}}], None), ([], views.STATUS_UNHEALTHY)):
+            health_checker = views.HealthChecker()
+            health_checker._configured["celery"] = True
+            health_checker.celery_app = mock.Mock()
+            health_checker.celery_app.control.ping.return_value = workers
+
+            first = health_checker.check_celery()
+            second = health_checker.check_celery()
+
+            self.assertEqual(first.get("status"), expected_status)
+            self.assertEqual(second, first)
+            health_checker.celery_app.control.ping.assert_called_once()
+
+    def test_celery_check_gives_up_on_silent_broker(self):
+        # A broker that accepts the connection but never replies must not hang the check.
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(5)
+        self.addCleanup(listener.close)
+        broker_url = f"redis://127.0.0.1:{listener.getsockname()[1]}/0"
+
+        with override_settings(CELERY_BROKER_URL=broker_url):
+            health_checker = views.HealthChecker()
+            health_checker._configured["celery"] = True
+            result_holder = []
+            worker = threading.Thread(target=lambda: result_holder.append(health_checker.check_celery()), daemon=True)
+            worker.start()
+            worker.join(10)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(result_holder[0]["status"], views.STATUS_UNHEALTHY)
+
+    def test_custom_urls_fall_back_to_get_when_head_is_refused(self):
+        requests_seen = []
+
+        class StubHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self, status):
+                requests_seen.append((self.command, self.path))
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_HEAD(self):
+                self._respond({"/ok": 200, "/down": 503}.get(self.path, 405))
+
+            def do_GET(self):
+                self._respond(200)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+
+        with override_settings(CUSTOM_URLS_TO_CHECK=[f"{base}/ok", f"{base}/down", f"{base}/no-head"]):
+            result = views.HealthChecker().check_custom_urls()
+
+        self.assertEqual(result["status"], views.STATUS_UNHEALTHY)
+        self.assertEqual(result["urls"][f"{base}/ok"], {})
+        self.assertEqual(result["urls"][f"{base}/down"], {"message": "HTTP 503"})
+        self.assertEqual(result["urls"][f"{base}/no-head"], {})
+        self.assertIn(("GET", "/no-head"), requests_seen)
+        self.assertNotIn(("GET", "/ok"), requests_seen)
+
+    def test_cached_results_are_not_recorded_in_metrics(self):
+        health_checker = views.HealthChecker()
+        health_checker._configured["celery"] = True
+        health_checker.celery_app = mock.Mock()
+        health_checker.celery_app.control.ping.return_value = [{"worker@host": {"ok": "pong"}}]
+        latency, ok_count = mock.Mock(), mock.Mock()
+
+        with mock.patch.dict(views._LAT, {"celery": latency}), \
+                mock.patch.dict(views._CNT_OK, {"celery": ok_count}), \
+                mock.patch.dict(views._CNT_BAD, {"celery": mock.Mock()}):
+            health_checker.run_check(health_checker.check_celery)
+            cached = health_checker.run_check(health_checker.check_celery)
+
+        self.assertEqual(cached["status"], views.STATUS_HEALTHY)
+        latency.observe.assert_called_once()
+        ok_count.inc.assert_called_once()
+
+    def test_custom_url_head_and_get_fallback_share_one_budget(self):
+        class SlowStubHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self, status):
+                time.sleep(0.3)
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_HEAD(self):
+                self._respond(405)
+
+            def do_GET(self):
+                self._respond(200)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowStubHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}/slow"
+
+        with override_settings(CUSTOM_URLS_TO_CHECK=[url]), mock.patch.object(views, 'PER_CHECK_TIMEOUT', 0.5):
+            result = views.HealthChecker().check_custom_urls()
+
+        self.assertEqual(result["status"], views.STATUS_UNHEALTHY)
+        self.assertEqual(result["urls"][url], {"message": "TimeoutError"})
+
+    def test_cached_ok_skips_recently_healthy_backend(self):
+        calls = []
+
+        class FakeChecker:
+            _last_ok = {}
+
+            @views.cached_ok("fake")
+            def check_fake(self):
+                calls.append(1)
+                return {} if len(calls) > 1 else {"message": "down"}
+
+        fake = FakeChecker()
+        fake.check_fake()
+        fake.check_fake()
+        self.assertIsInstance(fake.check_fake(), views.CachedResult)
+        self.assertEqual(len(calls), 2)
+
+
+class MetricsViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        views._METRICS_CACHE.update(ts=0.0, body=b"")
+
+    def test_metrics_view_reuses_rendered_output(self):
+        with mock.patch.object(views, 'generate_latest', return_value=b"# metrics\n") as generate_latest:
+            first = self.client.get(reverse('metrics'))
+            second = self.client.get(reverse('metrics'))
+        self.assertEqual(first.content, b"# metrics\n")
+        self.assertEqual(second.content, b"# metrics\n")
+        self.assertEqual(generate_latest.call_count, 1)
+
+    def test_metrics_module_imports_with_histogram_enabled(self):
+        # Metrics register in the global registry at import, so check in a fresh interpreter.
+        script = (
+            "import django; django.setup()\n"
+            "from django.conf import settings; settings.PROMETHEUS_HISOGRAM_ENABLED = True\n"
+            "from prometheus_client import generate_latest\n"
+            "from django_health_metrics import views\n"
+            "views.checker.run_check(views.checker.check_memory)\n"
+            "print(generate_latest().decode())\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run(
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertIn('health_check_total{service="memory",status="healthy"} 1.0', output)
+        self.assertNotIn('service="database"', output)
@@ -1,29 +1,35 @@
-from prometheus_client import generate_latest, REGISTRY, Counter, Histogram
-from functools import lru_cache
-from django.http import HttpResponse, JsonResponse
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, REGISTRY, Counter, Histogram
+from functools import wraps
+from django.http import HttpResponse
 from django.conf import settings
-from django.db import connections
+from django.db import DatabaseError, connections
 from django.core.cache import cache
-import redis
 import psutil
 import time
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Callable
-import pika
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, as_completed
+from typing import TYPE_CHECKING, Dict, Callable, Optional
 import threading
-from elasticsearch import Elasticsearch
-from celery import Celery
-import requests
+import orjson
+import asyncio
 
 
+if TYPE_CHECKING:
+    # Backend clients are imported lazily so disabled checks cost nothing at startup.
+    import redis
+    from celery import Celery
+    from elasticsearch import Elasticsearch
+
 logger = logging.getLogger(__name__)
 
 # Constants
-DEFAULT_TIMEOUT = getattr(settings, 'HEALTH_METRICS_DEFAULT_TIMEOUT', 2)
-"""Default timeout for network operations in seconds."""
+PER_CHECK_TIMEOUT = getattr(
+    settings, 'HEALTH_PER_CHECK_TIMEOUT', getattr(settings, 'HEALTH_METRICS_DEFAULT_TIMEOUT', 0.5)
+)
+"""Timeout for each individual health check's network operations in seconds.
+
+Falls back to the older ``HEALTH_METRICS_DEFAULT_TIMEOUT`` setting when only that one is set.
+"""
 DEFAULT_THREADS_TIMEOUT = getattr(settings, 'HEALTH_METRICS_THREADS_TIMEOUT', 10)
 """Default timeout for thread-related operations in seconds."""
 STATUS_HEALTHY = "healthy"
@@ -32,6 +38,18 @@ STATUS_UNHEALTHY = "unhealthy"
 """Status string for unhealthy services."""
 STATUS_NOT_CONNECTED = "not_connected"
 """Status string for services that are not connected."""
+EXPECTED_CHECK_ERRORS = (OSError,)
+"""Errors a check may raise for an unreachable service; anything else is logged with a traceback."""
+HEALTH_CACHE_TTL = getattr(settings, 'HEALTH_CACHE_TTL', 1.0)
+"""Seconds a computed health payload is served to subsequent requests."""
+HEALTH_MAX_WORKERS = getattr(settings, 'HEALTH_MAX_WORKERS', 10)
+"""Number of worker threads shared by all health check runs."""
+HEALTH_PING_INTERVAL = getattr(settings, 'HEALTH_PING_INTERVAL', 10.0)
+"""Seconds a successful backend check is trusted before the backend is contacted again."""
+CELERY_CACHE_TTL = getattr(settings, 'HEALTH_CELERY_CACHE_TTL', 15.0)
+"""Seconds a Celery worker ping result, healthy or not, is reused before broadcasting again."""
+METRICS_CACHE_TTL = getattr(settings, 'METRICS_CACHE_TTL', 1.0)
+"""Seconds the rendered Prometheus output is served to subsequent scrapes."""
 
 PROMETHEUS_HISOGRAM_ENABLED = getattr(settings, 'PROMETHEUS_HISOGRAM_ENABLED', False)
 """Flag to enable Prometheus histogram metrics."""
@@ -43,11 +61,11 @@ if PROMETHEUS_HISOGRAM_ENABLED:
         buckets=[0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30]
     )
     health_check_counter = Counter(
-        'health_check_latency_seconds',
-        'Health check latency in seconds',
-        ['service']
+        'health_check_total',
+        'Health checks run, by outcome',
+        ['service', 'status']
     )
-"""Prometheus histogram metric for health check latency."""
+"""Prometheus histogram of health check latency and counter of health check outcomes."""
 
 CHECK_CONFIG = {
     "redis": {"enabled": "ENABLE_REDIS_CHECK", "requires": ["REDIS_HOST", "REDIS_PORT", "REDIS_DB"]},
@@ -60,47 +78,119 @@ CHECK_CONFIG = {
 }
 """Configuration for optional health checks with their enabling flags and required settings."""
 
+class CachedResult(dict):
+    """A check result served from a cache rather than from the service itself.
+
+    ``run_check`` leaves these out of the Prometheus metrics, which should only
+    describe real round trips.
+    """
+
+def cached_ok(name: str) -> Callable:
+    """Skip a backend check while its last successful run is recent enough.
+
+    Args:
+        name: Key under which the last success is recorded in ``HealthChecker._last_ok``.
+
+    Returns:
+        Decorator for ``HealthChecker.check_*`` methods.
+    """
+    def decorator(check_func: Callable) -> Callable:
+        @wraps(check_func)
+        def wrapper(self, *args, **kwargs) -> Dict:
+            if time.monotonic() - self._last_ok.get(name, 0.0) < HEALTH_PING_INTERVAL:
+                return CachedResult()
+            try:
+                result = check_func(self, *args, **kwargs)
+            except Exception:
+                self._last_ok.pop(name, None)
+                raise
+            if result:
+                self._last_ok.pop(name, None)
+            else:
+                self._last_ok[name] = time.monotonic()
+            return result
+        return wrapper
+    return decorator
+
+_CPU_SAMPLE = psutil.cpu_percent(interval=None)
+"""Latest system-wide CPU usage, refreshed in the background by ``_cpu_sampler``."""
+
+def _cpu_sampler() -> None:
+    """Refresh ``_CPU_SAMPLE`` once per second for the lifetime of the process."""
+    global _CPU_SAMPLE
+    while True:
+        _CPU_SAMPLE = psutil.cpu_percent(interval=1.0)
+
+threading.Thread(target=_cpu_sampler, name='health-cpu-sampler', daemon=True).start()
+
 class HealthChecker:
     """A class to manage and execute health checks for various services.
 
     Attributes:
-        redis_client (redis.Redis): Reusable Redis client instance.
+        redis_client (redis.Redis): Reusable Redis client instance, backed by a connection pool.
         es_client (Elasticsearch): Reusable Elasticsearch client instance.
         celery_app (Celery): Reusable Celery app instance.
     """
 
     def __init__(self):
         self.redis_client = None
+        self._redis_pool = None
+        self._last_ok: Dict[str, float] = {}  # Monotonic time of each backend's last successful check
+        # Whether each optional check is enabled and has all of its required settings
+        self._configured = {
+            name: bool(getattr(settings, config["enabled"], False))
+            and all(hasattr(settings, req) for req in config["requires"])
+            for name, config in CHECK_CONFIG.items()
+        }
         self.es_client = None
         self.celery_app = None
-        self._requests_session = requests.Session()  # Reusable HTTP session for custom URLs
-        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retries)
-        self._requests_session.mount('http://', adapter)
-        self._requests_session.mount('https://', adapter)
-
-    def _get_redis_client(self) -> redis.Redis:
-        """Lazily initialize and return a Redis client."""
+        self._celery_last = (0.0, None)  # Monotonic time and result of the last Celery ping
+        self._url_loop = None  # Event loop thread running custom URL requests
+        self._url_session = None  # aiohttp session owned by that loop, reused across probes
+        self._url_lock = threading.Lock()
+
+    def _get_redis_client(self) -> "redis.Redis":
+        """Lazily initialize and return a Redis client backed by a keepalive connection pool."""
         if not self.redis_client:
-            self.redis_client = redis.Redis(
+            import redis
+            self._redis_pool = redis.ConnectionPool(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
                 decode_responses=True,
-                socket_timeout=DEFAULT_TIMEOUT
+                socket_timeout=PER_CHECK_TIMEOUT,
+                socket_connect_timeout=PER_CHECK_TIMEOUT,
+                socket_keepalive=True,
+                health_check_interval=30,
+                max_connections=getattr(settings, 'REDIS_POOL_SIZE', 8)
             )
+            self.redis_client = redis.Redis(connection_pool=self._redis_pool)
         return self.redis_client
 
-    def _get_es_client(self) -> Elasticsearch:
+    def _get_es_client(self) -> "Elasticsearch":
         """Lazily initialize and return an Elasticsearch client."""
         if not self.es_client:
-            self.es_client = Elasticsearch([settings.ELASTICSEARCH_HOST], timeout=DEFAULT_TIMEOUT)
+            from elasticsearch import Elasticsearch
+            self.es_client = Elasticsearch(
+                [settings.ELASTICSEARCH_HOST],
+                request_timeout=PER_CHECK_TIMEOUT,
+                max_retries=0
+            )
         return self.es_client
 
-    def _get_celery_app(self) -> Celery:
+    def _get_celery_app(self) -> "Celery":
         """Lazily initialize and return a Celery app."""
         if not self.celery_app:
+            from celery import Celery
             self.celery_app = Celery(broker=settings.CELERY_BROKER_URL)
+            # Bound connecting and every socket read so a silent broker cannot hang the check,
+            # and fail fast on an unreachable broker instead of retrying the publish for seconds.
+            self.celery_app.conf.broker_connection_timeout = PER_CHECK_TIMEOUT
+            self.celery_app.conf.broker_transport_options = {
+                "max_retries": 0,
+                "socket_timeout": PER_CHECK_TIMEOUT,
+                "socket_connect_timeout": PER_CHECK_TIMEOUT,
+            }
         return self.celery_app
 
     def run_check(self, check_func: Callable, *args, **kwargs) -> Dict:
@@ -112,79 +202,141 @@ class HealthChecker:
             **kwargs: Keyword arguments for the check function.
 
         Returns:
-            Dict containing the check result with response time in milliseconds.
+            Dict containing the check result with response time in whole milliseconds.
+            Checks report failures by returning an unhealthy status; an exception
+            escaping a check is treated as unhealthy too.
         """
         service_name = check_func.__name__.replace("check_", "")
+        start = time.monotonic_ns()
         try:
-            start = time.perf_counter()  # Higher precision than time.time()
             result = check_func(*args, **kwargs)
-            response_time = (time.perf_counter() - start) * 1000
-            if PROMETHEUS_HISOGRAM_ENABLED:
-                health_check_latency.labels(service=service_name).observe(response_time)
-                health_check_counter.labels(service=service_name, status="healthy").inc()
-            return {"status": STATUS_HEALTHY, "response_time_ms": response_time, **(result or {})}
         except Exception as e:
-            logger.error(f"Error in {check_func.__name__}: {e}")
+            if isinstance(e, EXPECTED_CHECK_ERRORS):
+                logger.error(f"Error in {check_func.__name__}: {e}")
+            else:
+                logger.exception(f"Unexpected error in {check_func.__name__}")
+            if service_name in _CNT_BAD:
+                _CNT_BAD[service_name].inc()
             return {"status": STATUS_UNHEALTHY, "message": str(e), "response_time_ms": 0}
-
-    @lru_cache(maxsize=None)
-    def _is_configured(self, check_name: str) -> bool:
-        """Check if a service is configured and enabled.
-
-        Args:
-            check_name: The name of the check (e.g., 'redis', 'database').
-
-        Returns:
-            True if the service is enabled and all required settings are present, False otherwise.
-        """
-        config = CHECK_CONFIG.get(check_name, {})
-        enabled = getattr(settings, config.get("enabled", ""), False)
-        if not enabled:
-            return False
-        return all(hasattr(settings, req) for req in config.get("requires", []))
-
+        if result is None:
+            result = {}
+        elapsed_ns = time.monotonic_ns() - start
+        response_time = elapsed_ns // 1_000_000
+        status = result.get("status", STATUS_HEALTHY)
+        if service_name in _LAT and not isinstance(result, CachedResult):
+            _LAT[service_name].observe(elapsed_ns / 1e9)
+            (_CNT_BAD if status == STATUS_UNHEALTHY else _CNT_OK)[service_name].inc()
+        return {"status": status, "response_time_ms": response_time, **result}
+
+    @cached_ok("redis")
     def check_redis(self) -> Dict:
         """Check Redis connectivity."""
-        if not self._is_configured("redis"):
+        if not self._configured.get("redis"):
             return {"status": "not_connected"}
-        self._get_redis_client().ping()
+        import redis
+        try:
+            self._get_redis_client().ping()
+        except redis.ConnectionError as e:
+            # Drop every pooled socket so the next probe reconnects from scratch.
+            self._redis_pool.disconnect()
+            return {"status": STATUS_UNHEALTHY, "message": str(e)}
+        except redis.RedisError as e:
+            return {"status": STATUS_UNHEALTHY, "message": str(e)}
         return {}
 
+    @cached_ok("database")
     def check_database(self) -> Dict:
         """Check database connectivity."""
-        if not self._is_configured("database"):
+        if not self._configured.get("database"):
             return {"status": "not_connected"}
-        connections['default'].cursor()
+        connection = connections['default']
+        try:
+            # Pool threads are long-lived and Django connections are per thread, so drop a
+            # broken or expired connection and make a real round trip every time.
+            connection.close_if_unusable_or_obsolete()
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except DatabaseError as e:
+            return {"status": STATUS_UNHEALTHY, "message": str(e)}
         return {}
 
     def check_cache(self) -> Dict:
         """Check cache read/write functionality."""
-        if not self._is_configured("cache"):
+        if not self._configured.get("cache"):
             return {"status": "not_connected"}
-        cache.set('health_check', 'ok', timeout=1)
-        return {} if cache.get('health_check') == 'ok' else {"message": "Cache read/write failed"}
+        try:
+            cache.set('health_check', 'ok', timeout=1)
+            value = cache.get('health_check')
+        except Exception as e:
+            # Each cache backend raises its own client's errors; they share no common base class.
+            return {"status": STATUS_UNHEALTHY, "message": str(e) or type(e).__name__}
+        if value != 'ok':
+            return {"status": STATUS_UNHEALTHY, "message": "Cache read/write failed"}
+        return {}
+
+    def _get_url_loop(self) -> asyncio.AbstractEventLoop:
+        """Lazily start and return the event loop that runs custom URL requests.
+
+        The aiohttp session is opened here too, so importing aiohttp and building
+        the session on the first probe do not count against any URL's deadline.
+        """
+        with self._url_lock:
+            if not self._url_loop:
+                self._url_loop = asyncio.new_event_loop()
+                threading.Thread(target=self._url_loop.run_forever, name='health-urls', daemon=True).start()
+                asyncio.run_coroutine_threadsafe(self._open_url_session(), self._url_loop).result()
+        return self._url_loop
+
+    async def _open_url_session(self) -> None:
+        """Create the shared aiohttp session; it must be built on the URL event loop."""
+        import aiohttp
+        self._url_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(sock_connect=0.2)
+        )
+
+    async def _fetch(self, url: str) -> int:
+        """Probe a custom URL on the shared session and return its HTTP status.
+
+        The HEAD request and any GET fallback share a single ``PER_CHECK_TIMEOUT`` budget.
+        """
+        return await asyncio.wait_for(self._probe(url), timeout=PER_CHECK_TIMEOUT)
+
+    async def _probe(self, url: str) -> int:
+        """Request a custom URL's status, falling back to GET when HEAD is refused."""
+        # Only the status matters, so avoid downloading the body unless HEAD is refused.
+        async with self._url_session.head(url, allow_redirects=True) as response:
+            if response.status not in (405, 501):
+                return response.status
+        async with self._url_session.get(url) as response:
+            return response.status
 
     def check_custom_urls(self) -> Dict:
-        """Check the health of custom URLs in parallel."""
+        """Check the health of custom URLs concurrently on the URL event loop."""
         urls = getattr(settings, 'CUSTOM_URLS_TO_CHECK', [])
         if not urls:
             return {"status": "None Provided"}
         
         results = {}
-        with ThreadPoolExecutor(max_workers=min(len(urls), 5)) as executor:
-            future_to_url = {
-                executor.submit(self._requests_session.get, url, timeout=DEFAULT_TIMEOUT): url
-                for url in urls
-            }
-            for future in future_to_url:
+        loop = self._get_url_loop()
+        future_to_url = {asyncio.run_coroutine_threadsafe(self._fetch(url), loop): url for url in urls}
+        try:
+            # Each URL's own budget normally fires first; this only catches stuck requests.
+            for future in as_completed(future_to_url, timeout=PER_CHECK_TIMEOUT * 1.5):
                 url = future_to_url[future]
                 try:
-                    response = future.result()
-                    results[url] = {} if response.status_code == 200 else {
-                        "message": f"HTTP {response.status_code}"
-                    }
+                    status_code = future.result()
+                    results[url] = {} if status_code == 200 else {"message": f"HTTP {status_code}"}
                 except Exception as e:
-                    results[url] = {"message": str(e)}
+                    results[url] = {"message": str(e) or type(e).__name__}
+        except TimeoutError:
+            for future, url in future_to_url.items():
+                if url not in results:
+                    future.cancel()
+                    logger.error(f"Custom URL check for {url} exceeded the deadline")
+                    results[url] = {"message": "deadline exceeded"}
+        if any(results.values()):
+            return {"status": STATUS_UNHEALTHY, "urls": results}
         return {"urls": results}
 
     def check_memory(self) -> Dict:
@@ -193,84 +345,215 @@ class HealthChecker:
         return {"total": memory.total, "available": memory.available, "percent": memory.percent}
 
     def check_cpu(self) -> Dict:
-        """Check CPU usage."""
-        return {"cpu_percent": psutil.cpu_percent(interval=0.1)}  # Reduced interval for faster response
+        """Check CPU usage, as last sampled by the background sampler."""
+        return {"cpu_percent": _CPU_SAMPLE}
 
     def check_threads(self) -> Dict:
         """Check active thread count."""
         return {"total_threads": threading.active_count()}
 
+    @cached_ok("rabbitmq")
     def check_rabbitmq(self) -> Dict:
         """Check RabbitMQ connectivity."""
-        if not self._is_configured("rabbitmq"):
+        if not self._configured.get("rabbitmq"):
             return {"status": "not_connected"}
-        connection = pika.BlockingConnection(
-            pika.ConnectionParameters(host=settings.RABBITMQ_HOST, socket_timeout=DEFAULT_TIMEOUT)
-        )
+        import pika
+        from pika.adapters.utils.connection_workflow import AMQPConnectorException
+        try:
+            connection = pika.BlockingConnection(
+                pika.ConnectionParameters(
+                    host=settings.RABBITMQ_HOST,
+                    socket_timeout=PER_CHECK_TIMEOUT,
+                    stack_timeout=PER_CHECK_TIMEOUT,  # Bounds the whole connect, including the AMQP handshake
+                    blocked_connection_timeout=PER_CHECK_TIMEOUT,
+                    connection_attempts=1
+                )
+            )
+        except (pika.exceptions.AMQPConnectionError, AMQPConnectorException) as e:
+            return {"status": STATUS_UNHEALTHY, "message": str(e) or type(e).__name__}
         connection.close()
         return {}
 
+    @cached_ok("elasticsearch")
     def check_elasticsearch(self) -> Dict:
         """Check Elasticsearch connectivity."""
-        if not self._is_configured("elasticsearch"):
+        if not self._configured.get("elasticsearch"):
             return {"status": "not_connected"}
-        return {} if self._get_es_client().ping() else {"message": "Elasticsearch ping failed"}
+        # ping() reports transport errors by returning False rather than raising.
+        if not self._get_es_client().ping():
+            return {"status": STATUS_UNHEALTHY, "message": "Elasticsearch ping failed"}
+        return {}
 
     def check_celery(self) -> Dict:
-        """Check Celery worker availability."""
-        if not self._is_configured("celery"):
+        """Check Celery worker availability.
+
+        The ping is a broadcast to every worker, so its outcome is reused for
+        ``CELERY_CACHE_TTL`` seconds whether it succeeded or not.
+        """
+        if not self._configured.get("celery"):
             return {"status": "not_connected"}
-        result = self._get_celery_app().control.ping(timeout=DEFAULT_TIMEOUT)
-        return {} if result else {"message": "No workers responded"}
+        pinged_at, last_result = self._celery_last
+        if last_result is not None and time.monotonic() - pinged_at < CELERY_CACHE_TTL:
+            return CachedResult(last_result)
+        from kombu.exceptions import OperationalError as KombuOperationalError
+        try:
+            workers = self._get_celery_app().control.ping(timeout=PER_CHECK_TIMEOUT)
+        except KombuOperationalError as e:
+            result = {"status": STATUS_UNHEALTHY, "message": str(e)}
+        else:
+            result = {} if workers else {"status": STATUS_UNHEALTHY, "message": "No workers responded"}
+        self._celery_last = (time.monotonic(), result)
+        return result
+
+_HEALTH_EXECUTOR = ThreadPoolExecutor(max_workers=HEALTH_MAX_WORKERS, thread_name_prefix='health')
+"""Persistent pool running the individual health checks."""
+_CHECK_FUTURES: Dict[str, Future] = {}
+"""Latest future submitted for each check, so a hung check is not submitted again."""
 
 checker = HealthChecker()
 
+_IO_CHECKS = [
+    (name, getattr(checker, f"check_{name}"))
+    for name in ("redis", "database", "cache", "custom_urls", "rabbitmq", "elasticsearch", "celery")
+    if checker._configured.get(name)
+]
+"""Enabled checks that talk to other services, run in parallel on ``_HEALTH_EXECUTOR``."""
+_LOCAL_CHECKS = [
+    ("memory", checker.check_memory),
+    ("cpu", checker.check_cpu),
+    ("threads", checker.check_threads),
+]
+"""In-process checks, cheap enough to run inline on the request thread."""
+_TEMPLATE = {name: None for name, _ in _IO_CHECKS + _LOCAL_CHECKS}
+_TEMPLATE["overall"] = None
+"""Skeleton of the health payload, copied per run so keys are laid out once in a fixed order."""
+
+# Labelled children are resolved once, and only for checks that run, so observations skip
+# the per-call label lookup and disabled services do not export empty series.
+_METRIC_SERVICES = [name for name, _ in _IO_CHECKS + _LOCAL_CHECKS] if PROMETHEUS_HISOGRAM_ENABLED else []
+_LAT = {name: health_check_latency.labels(service=name) for name in _METRIC_SERVICES}
+_CNT_OK = {name: health_check_counter.labels(service=name, status=STATUS_HEALTHY) for name in _METRIC_SERVICES}
+_CNT_BAD = {name: health_check_counter.labels(service=name, status=STATUS_UNHEALTHY) for name in _METRIC_SERVICES}
+
+_CACHE = {"ts": 0.0, "payload": None}
+"""Most recent health payload and the monotonic time it was computed."""
+_CACHE_LOCK = threading.Lock()
+"""Guards ``_CACHE`` and ``_inflight``."""
+_inflight: Optional[Future] = None
+"""Future of the health computation currently running, shared by concurrent requests."""
+
+_METRICS_CACHE = {"ts": 0.0, "body": b""}
+"""Most recently rendered Prometheus output and the monotonic time it was rendered."""
+_METRICS_LOCK = threading.Lock()
+"""Guards ``_METRICS_CACHE`` so concurrent scrapes render the registry only once."""
+
 def metrics_view(request):
     """Expose Prometheus metrics.
 
+    The rendered output is reused for ``METRICS_CACHE_TTL`` seconds so that
+    several scrapers hitting the endpoint at once do not each walk the registry.
+
     Args:
         request: The Django HTTP request object.
 
     Returns:
         HttpResponse with Prometheus metrics in text/plain format.
     """
-    return HttpResponse(generate_latest(REGISTRY), content_type='text/plain')
+    with _METRICS_LOCK:
+        if not _METRICS_CACHE["body"] or time.monotonic() - _METRICS_CACHE["ts"] >= METRICS_CACHE_TTL:
+            _METRICS_CACHE["body"] = generate_latest(REGISTRY)
+            _METRICS_CACHE["ts"] = time.monotonic()
+        body = _METRICS_CACHE["body"]
+    return HttpResponse(body, content_type=CONTENT_TYPE_LATEST)
+
+def _run_checks() -> Dict:
+    """Run every enabled health check in parallel and roll the results up.
+
+    Returns:
+        Dict mapping each check name to its result, plus an "overall" status.
+    """
+    results = _TEMPLATE.copy()
+    future_to_check = {}
+    for name, func in _IO_CHECKS:
+        previous = _CHECK_FUTURES.get(name)
+        if previous is not None and not previous.done():
+            # A running future cannot be cancelled; resubmitting would only tie up another worker.
+            results[name] = {"status": STATUS_UNHEALTHY, "message": "previous check still running", "response_time_ms": 0}
+            continue
+        future = _CHECK_FUTURES[name] = _HEALTH_EXECUTOR.submit(checker.run_check, func)
+        future_to_check[future] = name
+    for name, func in _LOCAL_CHECKS:
+        results[name] = checker.run_check(func)
+    try:
+        # Every check has its own client-side timeout; this only catches checks that ignore it.
+        for future in as_completed(future_to_check, timeout=PER_CHECK_TIMEOUT * 2):
+            # run_check never raises, it reports failures in the result itself.
+            results[future_to_check[future]] = future.result()
+    except TimeoutError:
+        for future, name in future_to_check.items():
+            if results[name] is None:
+                future.cancel()
+                logger.error(f"Health check {name} exceeded the deadline")
+                results[name] = {"status": STATUS_UNHEALTHY, "message": "deadline exceeded", "response_time_ms": 0}
+
+    unhealthy = any(result["status"] == STATUS_UNHEALTHY for result in results.values() if result)
+    results["overall"] = STATUS_UNHEALTHY if unhealthy else STATUS_HEALTHY
+    return results
+
+def _shared_run_checks() -> Dict:
+    """Run the health checks, joining a computation already in flight if any.
+
+    The first caller computes the results and stores them in ``_CACHE``; callers
+    arriving while it runs wait on the same future instead of starting their own.
+
+    Returns:
+        Dict of health check results as produced by ``_run_checks``.
+    """
+    global _inflight
+    with _CACHE_LOCK:
+        future = _inflight
+        leader = future is None
+        if leader:
+            future = _inflight = Future()
+
+    if not leader:
+        return future.result(timeout=DEFAULT_THREADS_TIMEOUT)
+
+    try:
+        payload = _run_checks()
+    except Exception as e:
+        with _CACHE_LOCK:
+            _inflight = None
+        future.set_exception(e)
+        raise
+
+    with _CACHE_LOCK:
+        _CACHE["payload"] = payload
+        _CACHE["ts"] = time.monotonic()
+        _inflight = None
+    future.set_result(payload)
+    return payload
 
 def health_view(request):
     """Perform health checks on configured services and return their status.
 
+    Results are reused for ``HEALTH_CACHE_TTL`` seconds so that frequent probes
+    do not each hit every backend, and concurrent probes share a single run.
+    Pass ``?fresh=1`` to bypass that cached payload; individual backend checks
+    still honour ``HEALTH_PING_INTERVAL`` and ``HEALTH_CELERY_CACHE_TTL``.
+
     Args:
         request: The Django HTTP request object.
 
     Returns:
-        JsonResponse containing the health status of all services.
+        HttpResponse with the health status of all services as JSON.
     """
-    checks = {
-        "redis": checker.check_redis,
-        "database": checker.check_database,
-        "cache": checker.check_cache,
-        "custom_urls": checker.check_custom_urls,
-        "memory": checker.check_memory,
-        "cpu": checker.check_cpu,
-        "threads": checker.check_threads,
-        "rabbitmq": checker.check_rabbitmq,
-        "elasticsearch": checker.check_elasticsearch,
-        "celery": checker.check_celery,
-    }
-
-    results = {}
-    with ThreadPoolExecutor(max_workers=min(len(checks), 10)) as executor:
-        future_to_check = {executor.submit(checker.run_check, func): name for name, func in checks.items()}
-        for future in future_to_check:
-            try:
-                name = future_to_check[future]
-                result = future.result(timeout=DEFAULT_THREADS_TIMEOUT)
-                results[name] = result if result["status"] == STATUS_NOT_CONNECTED else {
-                    "status": STATUS_HEALTHY if result.get("status") != STATUS_UNHEALTHY else STATUS_UNHEALTHY,
-                    **result
-                }
-            except Exception as e:
-                logger.error(f"Error in health check: {e}")
-                results[name] = {"status": STATUS_UNHEALTHY, "message": str(e), "response_time_ms": 0}
-
-    return JsonResponse(results)
\ No newline at end of file
+    with _CACHE_LOCK:
+        payload = _CACHE["payload"]
+        if payload is not None and time.monotonic() - _CACHE["ts"] >= HEALTH_CACHE_TTL:
+            payload = None
+
+    if payload is None or request.GET.get("fresh"):
+        payload = _shared_run_checks()
+
+    return HttpResponse(orjson.dumps(payload), content_type='application/json')
@@ -19,8 +19,8 @@ setup(
         'elasticsearch',
         'pika',
         'celery',
-        'pymongo',
-        'requests',
+        'aiohttp',
+        'orjson',
     ],
     classifiers=[
         'Framework :: Django',
@@ -28,5 +28,5 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )
\ No newline at end of file
@@ -9,4 +9,5 @@ DATABASES = {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': ':memory:',
     }
-}
\ No newline at end of file
+}
+ROOT_URLCONF = 'django_health_metrics.urls'